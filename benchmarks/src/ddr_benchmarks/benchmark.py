@@ -27,6 +27,7 @@ from ddr import ddr_functions, dmc, kan, streamflow
 from ddr._version import __version__
 from ddr.geodatazoo.dataclasses import Dates, RoutingDataclass
 from ddr.io.readers import read_zarr
+from ddr.scripts_utils import load_checkpoint
 from ddr.validation import Config, Metrics, plot_box_fig, plot_cdf, plot_gauge_map, plot_time_series, utils
 from ddr.validation.enums import GeoDataset
 
@@ -709,14 +710,7 @@ def benchmark(
     dataset = cfg.geodataset.get_dataset_class(cfg=cfg)
 
     if cfg.experiment.checkpoint:
-        file_path = Path(cfg.experiment.checkpoint)
-        device = torch.device(cfg.device)
-        log.info(f"Loading spatial_nn from checkpoint: {file_path.stem}")
-        state = torch.load(file_path, map_location=device)
-        state_dict = state["model_state_dict"]
-        for key in state_dict.keys():
-            state_dict[key] = state_dict[key].to(device)
-        nn.load_state_dict(state_dict)
+        load_checkpoint(nn, cfg.experiment.checkpoint, torch.device(cfg.device))
     else:
         log.warning("Creating new spatial model for evaluation.")
 
@@ -7,10 +7,13 @@ Usage:
 import argparse
 from pathlib import Path
 
-import geopandas as gpd
+import pyogrio
 
 from . import build_gauge_adjacencies, build_merit_adjacency
 
+#: Attribute columns the adjacency/attribute builds actually consume.
+MERIT_COLUMNS = ["COMID", "NextDownID", "up1", "up2", "up3", "up4", "lengthkm", "slope"]
+
 
 def main() -> None:
     """The main function for the MERIT engine"""
@@ -37,7 +40,15 @@ def main() -> None:
     args = parser.parse_args()
 
     print(f"Reading MERIT data from {args.pkg}")
-    fp = gpd.read_file(args.pkg)
+    # The builds only touch tabular attributes, so skip geometry decoding and
+    # use Arrow transport instead of gpd.read_file's per-row conversions
+    fields = set(pyogrio.read_info(args.pkg)["fields"])
+    fp = pyogrio.read_dataframe(
+        args.pkg,
+        columns=[c for c in MERIT_COLUMNS if c in fields],
+        read_geometry=False,
+        use_arrow=True,
+    )
 
     out_path = args.path / "merit_conus_adjacency.zarr"
     build_merit_adjacency(fp, out_path)
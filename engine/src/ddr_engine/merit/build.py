@@ -5,6 +5,7 @@ from typing import Any
 
 import geopandas as gpd
 import numpy as np
+import pandas as pd
 import polars as pl
 import rustworkx as rx
 import zarr
@@ -18,14 +19,14 @@ from .io import coo_to_zarr, coo_to_zarr_group, create_subset_coo
 
 
 def create_adjacency_matrix(
-    fp: gpd.GeoDataFrame,
+    fp: gpd.GeoDataFrame | pd.DataFrame,
 ) -> tuple[sparse.coo_matrix, list[int]]:
     """
     Create a lower triangular adjacency matrix from MERIT flowpaths.
 
     Parameters
     ----------
-    fp : gpd.GeoDataFrame
+    fp : gpd.GeoDataFrame | pd.DataFrame
         Flowpaths dataframe with 'COMID', 'NextDownID', and 'up1'-'up4' columns.
 
     Returns
@@ -64,7 +65,7 @@ def create_adjacency_matrix(
 
         print(f"Removing {len(cycle_comids)} flowpaths involved in cycles")
 
-        fp_pl = pl.DataFrame(fp.drop(columns="geometry"))
+        fp_pl = pl.DataFrame(fp.drop(columns="geometry", errors="ignore"))
         fp_filtered_pl = fp_pl.filter(~pl.col("COMID").is_in(list(cycle_comids)))
 
         fp_filtered = fp[fp["COMID"].isin(fp_filtered_pl["COMID"].to_list())].copy()
@@ -107,7 +108,7 @@ def create_adjacency_matrix(
     return matrix, id_order
 
 
-def write_merit_flowpath_attributes(fp: gpd.GeoDataFrame, out_path: Path) -> None:
+def write_merit_flowpath_attributes(fp: gpd.GeoDataFrame | pd.DataFrame, out_path: Path) -> None:
     """Extract flowpath physical attributes from a MERIT GeoDataFrame and write them to an existing zarr store.
 
     Reads ``lengthkm`` and ``slope`` columns from the GeoDataFrame and writes
@@ -118,7 +119,7 @@ def write_merit_flowpath_attributes(fp: gpd.GeoDataFrame, out_path: Path) -> Non
 
     Parameters
     ----------
-    fp : gpd.GeoDataFrame
+    fp : gpd.GeoDataFrame | pd.DataFrame
         MERIT flowpaths GeoDataFrame (must contain ``COMID``, ``lengthkm``,
         and ``slope`` columns).
     out_path : Path
@@ -162,7 +163,7 @@ def write_merit_flowpath_attributes(fp: gpd.GeoDataFrame, out_path: Path) -> Non
 
 
 def build_merit_adjacency(
-    fp: gpd.GeoDataFrame,
+    fp: gpd.GeoDataFrame | pd.DataFrame,
     out_path: Path,
 ) -> Path:
     """
@@ -170,7 +171,7 @@ def build_merit_adjacency(
 
     Parameters
     ----------
-    fp : gpd.GeoDataFrame
+    fp : gpd.GeoDataFrame | pd.DataFrame
         Flowpaths with COMID, NextDownID, up1-up4 columns.
     out_path : Path
         Path to save the zarr group.
@@ -204,7 +205,7 @@ def build_merit_adjacency(
 
 
 def build_gauge_adjacencies(
-    fp: gpd.GeoDataFrame,
+    fp: gpd.GeoDataFrame | pd.DataFrame,
     merit_zarr_path: Path,
     gauge_set: GaugeSet,
     out_path: Path,
@@ -214,7 +215,7 @@ def build_gauge_adjacencies(
 
     Parameters
     ----------
-    fp : gpd.GeoDataFrame
+    fp : gpd.GeoDataFrame | pd.DataFrame
         Flowpaths with COMID, NextDownID, up1-up4 columns.
     merit_zarr_path : Path
         Path to the MERIT adjacency zarr store.
@@ -1,28 +1,30 @@
 """Graph construction and traversal utilities for MERIT flowpaths"""
 
 import geopandas as gpd
+import pandas as pd
 import polars as pl
 import rustworkx as rx
 from tqdm import tqdm
 
 
 def build_upstream_dict(
-    fp: gpd.GeoDataFrame,
+    fp: gpd.GeoDataFrame | pd.DataFrame,
 ) -> dict[int, list[int]]:
     """
     Build upstream connectivity dictionary from MERIT flowpaths.
 
     Parameters
     ----------
-    fp : gpd.GeoDataFrame
-        Flowpaths with COMID, NextDownID, and up1-up4 columns.
+    fp : gpd.GeoDataFrame | pd.DataFrame
+        Flowpaths with COMID, NextDownID, and up1-up4 columns. Geometry is
+        ignored and may be absent (attribute-only pyogrio reads).
 
     Returns
     -------
     dict[int, list[int]]
         Dictionary mapping downstream COMID to list of upstream COMIDs.
     """
-    df = pl.DataFrame(fp.drop(columns="geometry"))
+    df = pl.DataFrame(fp.drop(columns="geometry", errors="ignore"))
 
     connections = []
     for up_col in ["up1", "up2", "up3", "up4"]:
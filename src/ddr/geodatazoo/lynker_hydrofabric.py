@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Any
 
 import numpy as np
+import pandas as pd
 import rustworkx as rx
 import torch
 from scipy import sparse
@@ -50,11 +51,17 @@ class LynkerHydrofabric(BaseGeoDataset):
         # Load attributes
         self.attribute_ds = self._load_attributes()
         self.attr_stats = set_statistics(self.cfg, self.attribute_ds)
-        self.id_to_index = {
-            divide_id: idx for idx, divide_id in enumerate(self.attribute_ds.divide_id.values)
-        }
+        self.id_index = pd.Index(self.attribute_ds.divide_id.values)
         self.attributes_list = list(self.cfg.kan.input_var_names)
 
+        # Materialize the full attribute matrix once; per-batch access in
+        # _get_attributes is then a column gather instead of an icechunk read
+        self.attr_values = torch.from_numpy(
+            self.attribute_ds[self.attributes_list].to_array().values.astype(np.float32)
+        )
+        if str(self.cfg.device).startswith("cuda") and torch.cuda.is_available():
+            self.attr_values = self.attr_values.pin_memory()
+
         # Precompute mean/std tensors for normalization
         self.means = torch.tensor(
             [self.attr_stats[attr].iloc[2] for attr in self.attributes_list],
@@ -109,17 +116,15 @@ class LynkerHydrofabric(BaseGeoDataset):
         dtype: torch.dtype = torch.float32,
     ) -> torch.Tensor:
         """Fetch attributes for the given divide IDs."""
-        valid_indices = []
-        divide_idx_mask = []
+        indexer = self.id_index.get_indexer(catchment_ids)
+        found_mask = indexer >= 0
+        valid_indices = indexer[found_mask]
+        divide_idx_mask = np.where(found_mask)[0]
 
-        for i, divide_id in enumerate(catchment_ids):
-            if divide_id in self.id_to_index:
-                valid_indices.append(self.id_to_index[divide_id])
-                divide_idx_mask.append(i)
-            else:
-                log.debug(f"{divide_id} missing from the loaded attributes")
+        if not found_mask.all():
+            log.debug(f"{(~found_mask).sum()} divide IDs missing from the loaded attributes")
 
-        assert valid_indices, "No valid divide IDs found in this batch"
+        assert len(valid_indices) > 0, "No valid divide IDs found in this batch"
 
         output = torch.full(
             (len(self.attributes_list), len(catchment_ids)),
@@ -128,8 +133,7 @@ class LynkerHydrofabric(BaseGeoDataset):
             dtype=dtype,
         )
 
-        _ds = self.attribute_ds[self.attributes_list].isel(divide_id=valid_indices).compute()
-        data_tensor = torch.from_numpy(_ds.to_array(dim="divide_id").values).to(device=device, dtype=dtype)
+        data_tensor = self.attr_values[:, valid_indices].to(device=device, dtype=dtype, non_blocking=True)
 
         output[:, divide_idx_mask] = data_tensor
         return fill_nans(attr=output, row_means=self.means)
@@ -207,11 +211,12 @@ class LynkerHydrofabric(BaseGeoDataset):
         )
         gage_indices = np.array(_gage_idx, dtype=int)
         active_indices = np.unique(np.concatenate([edge_indices, gage_indices]))
-        index_mapping = {orig_idx: compressed_idx for compressed_idx, orig_idx in enumerate(active_indices)}
 
+        # active_indices is sorted (np.unique), so searchsorted *is* the
+        # CONUS-index -> compressed-index mapping
         if coo.nnz > 0:
-            compressed_rows = np.array([index_mapping[idx] for idx in coo.row])
-            compressed_cols = np.array([index_mapping[idx] for idx in coo.col])
+            compressed_rows = np.searchsorted(active_indices, coo.row)
+            compressed_cols = np.searchsorted(active_indices, coo.col)
         else:
             compressed_rows = np.array([], dtype=int)
             compressed_cols = np.array([], dtype=int)
@@ -231,9 +236,9 @@ class LynkerHydrofabric(BaseGeoDataset):
             local_gage_inflow_idx = np.where(mask)[0]
             original_col_indices = coo.col[local_gage_inflow_idx]
             if len(original_col_indices) > 0:
-                compressed_col_indices = np.array([index_mapping[idx] for idx in original_col_indices])
+                compressed_col_indices = np.searchsorted(active_indices, original_col_indices)
             else:
-                compressed_col_indices = np.array([index_mapping[int(_idx)]])
+                compressed_col_indices = np.searchsorted(active_indices, np.array([int(_idx)]))
             outflow_idx.append(compressed_col_indices)
 
         # Validate outflow_idx against flowpath attrs, excluding headwater gages
@@ -263,7 +268,7 @@ class LynkerHydrofabric(BaseGeoDataset):
                 )
             ).all(), "Gage WB don't match up with indices"
 
-        gage_compressed_indices = [index_mapping[int(idx)] for idx in _gage_idx]
+        gage_compressed_indices = np.searchsorted(active_indices, gage_indices).tolist()
         flow_scale = build_flow_scale_tensor(
             batch=batch,
             gage_dict=self.obs_reader.gage_dict,
@@ -321,10 +326,8 @@ class LynkerHydrofabric(BaseGeoDataset):
             dtype=torch.float32,
         )
 
-        for r in range(spatial_attributes.shape[0]):
-            row_means = torch.nanmean(spatial_attributes[r])
-            nan_mask = torch.isnan(spatial_attributes[r])
-            spatial_attributes[r, nan_mask] = row_means
+        row_means = torch.nanmean(spatial_attributes, dim=1, keepdim=True)
+        spatial_attributes = torch.where(torch.isnan(spatial_attributes), row_means, spatial_attributes)
 
         normalized_spatial_attributes = (spatial_attributes - self.means) / self.stds
         normalized_spatial_attributes = normalized_spatial_attributes.T
@@ -379,12 +382,8 @@ class LynkerHydrofabric(BaseGeoDataset):
         cols = self.conus_adjacency["indices_1"][:]
         data = self.conus_adjacency["values"][:]
 
-        mask = np.array(
-            [
-                r in all_ancestor_indices and c in all_ancestor_indices
-                for r, c in zip(rows, cols, strict=False)
-            ]
-        )
+        ancestor_arr = np.fromiter(all_ancestor_indices, dtype=rows.dtype)
+        mask = np.isin(rows, ancestor_arr) & np.isin(cols, ancestor_arr)
         filtered_rows = rows[mask]
         filtered_cols = cols[mask]
         filtered_data = data[mask]
@@ -395,10 +394,9 @@ class LynkerHydrofabric(BaseGeoDataset):
         )
 
         active_indices = np.unique(np.concatenate([coo.row, coo.col]))
-        index_mapping = {orig_idx: compressed_idx for compressed_idx, orig_idx in enumerate(active_indices)}
 
-        compressed_rows = np.array([index_mapping[idx] for idx in coo.row])
-        compressed_cols = np.array([index_mapping[idx] for idx in coo.col])
+        compressed_rows = np.searchsorted(active_indices, coo.row)
+        compressed_cols = np.searchsorted(active_indices, coo.col)
 
         compressed_size = len(active_indices)
         compressed_coo = sparse.coo_matrix(
@@ -486,11 +484,10 @@ class LynkerHydrofabric(BaseGeoDataset):
         )
         gage_indices = np.array(_gage_idx, dtype=int)
         active_indices = np.unique(np.concatenate([edge_indices, gage_indices]))
-        index_mapping = {orig_idx: compressed_idx for compressed_idx, orig_idx in enumerate(active_indices)}
 
         if coo.nnz > 0:
-            compressed_rows = np.array([index_mapping[idx] for idx in coo.row])
-            compressed_cols = np.array([index_mapping[idx] for idx in coo.col])
+            compressed_rows = np.searchsorted(active_indices, coo.row)
+            compressed_cols = np.searchsorted(active_indices, coo.col)
         else:
             compressed_rows = np.array([], dtype=int)
             compressed_cols = np.array([], dtype=int)
@@ -510,12 +507,12 @@ class LynkerHydrofabric(BaseGeoDataset):
             local_gage_inflow_idx = np.where(mask)[0]
             original_col_indices = coo.col[local_gage_inflow_idx]
             if len(original_col_indices) > 0:
-                compressed_col_indices = np.array([index_mapping[idx] for idx in original_col_indices])
+                compressed_col_indices = np.searchsorted(active_indices, original_col_indices)
             else:
-                compressed_col_indices = np.array([index_mapping[int(_idx)]])
+                compressed_col_indices = np.searchsorted(active_indices, np.array([int(_idx)]))
             outflow_idx.append(compressed_col_indices)
 
-        gage_compressed_indices = [index_mapping[int(idx)] for idx in _gage_idx]
+        gage_compressed_indices = np.searchsorted(active_indices, gage_indices).tolist()
         flow_scale = build_flow_scale_tensor(
             batch=batch,
             gage_dict=self.obs_reader.gage_dict,
@@ -74,7 +74,8 @@ def construct_network_matrix(
     KeyError
         Cannot find a gauge from the batch in the gages_adjacency.zarr Group
     """
-    coordinates: set[tuple[int, int]] = set()
+    row_arrays: list[np.ndarray] = []
+    col_arrays: list[np.ndarray] = []
     output_idx: list[str] = []
     output_wb: list[str] = []
     _attrs: dict[str, Any] = {}
@@ -84,10 +85,8 @@ def construct_network_matrix(
         except KeyError:
             msg = f"Cannot find gage {_id} in subsets zarr store. Skipping"
             log.info(msg)
-        _r: list[int] = gauge_root["indices_0"][:].tolist()
-        _c: list[int] = gauge_root["indices_1"][:].tolist()
-        for row, col in zip(_r, _c, strict=False):
-            coordinates.add((row, col))
+        row_arrays.append(gauge_root["indices_0"][:])
+        col_arrays.append(gauge_root["indices_1"][:])
         try:
             _attrs = dict(gauge_root.attrs)
             output_idx.append(_attrs["gage_idx"])
@@ -95,17 +94,21 @@ def construct_network_matrix(
         except KeyError:
             msg = f"Cannot find gauge attributes for gage {_id}. Skipping"
             log.info(msg)
-    if coordinates:
-        rows_tuple, cols_tuple = zip(*coordinates, strict=False)
-        rows: list[int] = list(rows_tuple)
-        cols: list[int] = list(cols_tuple)
+    if row_arrays:
+        rows = np.concatenate(row_arrays).astype(np.int64)
+        cols = np.concatenate(col_arrays).astype(np.int64)
     else:
-        rows, cols = [], []
+        rows = np.array([], dtype=np.int64)
+        cols = np.array([], dtype=np.int64)
     shape = tuple(_attrs["shape"])
     coo = sparse.coo_matrix(
         (np.ones(len(rows)), (rows, cols)),
         shape=shape,
     )
+    # Subgraphs from different gages share edges; collapse duplicates in C
+    # (replaces the old per-edge Python set) and restore unit edge weights.
+    coo.sum_duplicates()
+    coo.data.fill(1.0)
     return coo, output_idx, output_wb
 
 
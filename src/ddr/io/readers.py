@@ -440,7 +440,10 @@ def read_ic(store: str, region: str = "us-east-2") -> xr.Dataset:
         storage_config = ic.local_filesystem_storage(store)
     repo = ic.Repository.open(storage_config)
     session = repo.readonly_session("main")
-    return xr.open_zarr(session.store, consolidated=False)
+    # chunks=None skips dask entirely — downstream access is isel/sel on a
+    # lazy zarr-backed array, so building a per-chunk task graph at open
+    # time is pure overhead
+    return xr.open_zarr(session.store, consolidated=False, chunks=None)
 
 
 class StreamflowReader(torch.nn.Module):
@@ -557,7 +560,10 @@ class IcechunkUSGSReader:
         """
         padded_gage_ids = [str(gage_id).zfill(8) for gage_id in self.gage_dict["STAID"]]
         ds_ = self.ds.sel(gage_id=padded_gage_ids).isel(time=dates.numerical_time_range)
-        return ds_
+        # Materialize the (gage, day) window once — it's small, and every
+        # batch's create_hydrofabric_observations sel then slices this
+        # in-memory array instead of re-reading from the store
+        return ds_.compute()
 
 
 class AttributesReader(torch.nn.Module):
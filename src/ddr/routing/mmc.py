@@ -6,14 +6,15 @@ implementation.
 """
 
 import logging
-from typing import Any
+import math
+from collections.abc import Callable
+from typing import Any, cast
 
 import torch
 from tqdm import tqdm
 
 from ddr.routing.utils import (
     PatternMapper,
-    denormalize,
     get_network_idx,
     triangular_sparse_solve,
 )
@@ -66,9 +67,90 @@ def compute_hotstart_discharge(
     return torch.clamp(discharge, min=discharge_lb)
 
 
-def _log_base_q(x: torch.Tensor, q: float) -> torch.Tensor:
-    """Calculate logarithm with base q."""
-    return torch.log(x) / torch.log(torch.tensor(q, dtype=x.dtype))
+def _log_base_q(x: torch.Tensor, q: torch.Tensor | float) -> torch.Tensor:
+    """Calculate logarithm with base q.
+
+    Accepts q as a tensor (e.g. _q_spatial) or a Python float; neither case
+    allocates a new tensor for the base, so calling this per-timestep costs
+    no host-to-device copy.
+    """
+    if isinstance(q, torch.Tensor):
+        return torch.log(x) / torch.log(q)
+    return torch.log(x) / math.log(q)
+
+
+# torch.jit.script emits a DeprecationWarning as of torch 2.13 (filtered in
+# pyproject.toml); it is kept over torch.compile for these tiny elementwise
+# kernels because it has no first-call compile latency and no graph-break risk
+@torch.jit.script
+def _muskingum_coefficients(
+    length: torch.Tensor, velocity: torch.Tensor, x_storage: torch.Tensor, t: torch.Tensor
+) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
+    """Elementwise Muskingum-Cunge coefficient math, scripted for kernel fusion.
+
+    Runs once per timestep inside the routing loop; TorchScript fuses the
+    chain of elementwise ops into a single kernel instead of ~10 separate
+    launches each round-tripping an N-length intermediate through memory.
+    """
+    # Shared subterms: 2k and 2kx appear in every coefficient, and
+    # c_3 = (denom - 2t) / denom = 1 - c_4, so one division + one
+    # reciprocal replace four divisions and the duplicated 2k(1-x) chain
+    k2 = 2.0 * torch.div(length, velocity)
+    kx2 = k2 * x_storage
+    inv_denom = torch.reciprocal(k2 - kx2 + t)
+    c_1 = (t - kx2) * inv_denom
+    c_2 = (t + kx2) * inv_denom
+    c_4 = (2.0 * t) * inv_denom
+    c_3 = 1.0 - c_4
+    return c_1, c_2, c_3, c_4
+
+
+@torch.jit.script
+def _muskingum_rhs(
+    c_1: torch.Tensor,
+    c_2: torch.Tensor,
+    c_3: torch.Tensor,
+    c_4: torch.Tensor,
+    i_t: torch.Tensor,
+    discharge_t: torch.Tensor,
+    q_prime_clamp: torch.Tensor,
+) -> tuple[torch.Tensor, torch.Tensor]:
+    """Assemble the right-hand side b and the negated c_1 diagonal vector.
+
+    Scripted alongside _muskingum_coefficients so the per-timestep
+    elementwise chain stays fused.
+    """
+    b = (c_2 * i_t) + (c_3 * discharge_t) + (c_4 * q_prime_clamp)
+    c_1_ = c_1 * -1
+    c_1_[0] = 1.0
+    return c_1_, b
+
+
+def _make_affine(
+    lo: torch.Tensor, scale: torch.Tensor, log_space: bool
+) -> Callable[[torch.Tensor], torch.Tensor]:
+    """Bind a [0,1] -> physical-bounds transform over device-resident constants.
+
+    Parameters
+    ----------
+    lo : torch.Tensor
+        Lower bound (log of it for log-space parameters).
+    scale : torch.Tensor
+        Bound range (log-range for log-space parameters).
+    log_space : bool
+        If True, exponentiate the affine result (right-skewed parameters).
+
+    Returns
+    -------
+    Callable[[torch.Tensor], torch.Tensor]
+        Transform applying a fused addcmul (and exp for log-space).
+    """
+
+    def transform(value: torch.Tensor) -> torch.Tensor:
+        out = torch.addcmul(lo, value, scale)
+        return torch.exp(out) if log_space else out
+
+    return transform
 
 
 def _apply_data_override(derived: torch.Tensor, data: torch.Tensor | None) -> torch.Tensor:
@@ -196,9 +278,27 @@ class MuskingumCunge:
         self.q_spatial: torch.Tensor | None = None
         self._discharge_t: torch.Tensor | None = None
         self.network: torch.Tensor | None = None
+        self._network_source: torch.Tensor | None = None
 
         # Parameter bounds and defaults
         self.parameter_bounds = self.cfg.params.parameter_ranges
+        # Bounds are fixed at construction, so bind each parameter's affine
+        # transform (lo + value * scale, fused addcmul) as a closure over
+        # device-resident constants instead of rebuilding it every forward
+        self._denorm: dict[str, Callable[[torch.Tensor], torch.Tensor]] = {}
+        for key, bounds in self.parameter_bounds.items():
+            log_space = key in self.cfg.params.log_space_parameters
+            if log_space:
+                lo_val = math.log(bounds[0] + 1e-6)
+                scale_val = math.log(bounds[1]) - lo_val
+            else:
+                lo_val = bounds[0]
+                scale_val = bounds[1] - bounds[0]
+            self._denorm[key] = _make_affine(
+                torch.tensor(lo_val, device=self.device),
+                torch.tensor(scale_val, device=self.device),
+                log_space,
+            )
         self.p_spatial = torch.tensor(self.cfg.params.defaults["p_spatial"], device=self.device)
         self.velocity_lb = torch.tensor(self.cfg.params.attribute_minimums["velocity"], device=self.device)
         self.depth_lb = torch.tensor(self.cfg.params.attribute_minimums["depth"], device=self.device)
@@ -234,6 +334,11 @@ class MuskingumCunge:
         self._num_outputs: int | None = None
         self._scatter_input: torch.Tensor | None = None
 
+        # Cached pattern mapper (rebuilt only when the network topology changes)
+        self._mapper: PatternMapper | None = None
+        self._mapper_rows: torch.Tensor | None = None
+        self._mapper_cols: torch.Tensor | None = None
+
     def set_progress_info(self, epoch: int, mini_batch: int) -> None:
         """Set progress information for display purposes.
 
@@ -279,7 +384,15 @@ class MuskingumCunge:
         else:
             self.observations = None
 
-        self.network = routing_dataclass.adjacency_matrix
+        if self._network_source is not routing_dataclass.adjacency_matrix:
+            self._network_source = routing_dataclass.adjacency_matrix
+            network = routing_dataclass.adjacency_matrix
+            if network.layout == torch.strided:
+                # Keep the per-timestep upstream aggregation an O(nnz) SpMV;
+                # a dense river-network matmul is O(N^2) for ~2 nonzeros/row
+                network = network.to_sparse_csr()
+            self.network = network
+            self._mapper = None  # topology changed; rebuilt lazily by create_pattern_mapper()
 
         self.length = routing_dataclass.length.to(self.device).to(torch.float32)
         self.slope = torch.clamp(
@@ -306,26 +419,13 @@ class MuskingumCunge:
     def _denormalize_spatial_parameters(self, spatial_parameters: dict[str, torch.Tensor]) -> None:
         """Denormalize NN [0,1] outputs to physical parameter bounds with log-space handling."""
         self.spatial_parameters = spatial_parameters
-        log_space_params = self.cfg.params.log_space_parameters
 
-        self.n = denormalize(
-            value=spatial_parameters["n"],
-            bounds=self.parameter_bounds["n"],
-            log_space="n" in log_space_params,
-        )
-        self.q_spatial = denormalize(
-            value=spatial_parameters["q_spatial"],
-            bounds=self.parameter_bounds["q_spatial"],
-            log_space="q_spatial" in log_space_params,
-        )
+        self.n = self._denorm["n"](spatial_parameters["n"])
+        self.q_spatial = self._denorm["q_spatial"](spatial_parameters["q_spatial"])
 
         # p_spatial: use learned value if in spatial_parameters, otherwise use default
-        if "p_spatial" in spatial_parameters and "p_spatial" in self.parameter_bounds:
-            self.p_spatial = denormalize(
-                value=spatial_parameters["p_spatial"],
-                bounds=self.parameter_bounds["p_spatial"],
-                log_space="p_spatial" in log_space_params,
-            )
+        if "p_spatial" in spatial_parameters and "p_spatial" in self._denorm:
+            self.p_spatial = self._denorm["p_spatial"](spatial_parameters["p_spatial"])
 
     def _init_discharge_state(self, carry_state: bool) -> None:
         """Cold-start via topological accumulation, or carry from previous batch."""
@@ -411,6 +511,14 @@ class MuskingumCunge:
             )
             output[:, 0] = torch.clamp(initial, min=self.discharge_lb)
 
+        # Clamp all lateral inflows once; the loop then just slices rows
+        q_prime_clamp = torch.clamp(self.q_prime, min=self.discharge_lb)
+
+        # Bind scatter indices to locals so the loop avoids per-step Optional checks
+        flat_indices = self._flat_indices
+        group_ids = self._group_ids
+        scatter_input = self._scatter_input
+
         # Route through time series
         for timestep in tqdm(
             range(1, num_timesteps),
@@ -418,23 +526,18 @@ class MuskingumCunge:
             ncols=140,
             ascii=True,
         ):
-            q_prime_clamp = torch.clamp(
-                self.q_prime[timestep - 1],
-                min=self.cfg.params.attribute_minimums["discharge"],
-            )
-
-            q_t1 = self.route_timestep(q_prime_clamp=q_prime_clamp, mapper=mapper)
+            q_t1 = self.route_timestep(q_prime_clamp=q_prime_clamp[timestep - 1], mapper=mapper)
 
             if output_all:
                 output[:, timestep] = q_t1
             else:
-                if self._flat_indices is None or self._group_ids is None or self._scatter_input is None:
+                if flat_indices is None or group_ids is None or scatter_input is None:
                     raise ValueError("Scatter indices not initialized")
-                gathered = q_t1[self._flat_indices]
+                gathered = q_t1[flat_indices]
                 output[:, timestep] = torch.scatter_add(
-                    input=self._scatter_input,
+                    input=scatter_input,
                     dim=0,
-                    index=self._group_ids,
+                    index=group_ids,
                     src=gathered,
                 )
 
@@ -443,7 +546,11 @@ class MuskingumCunge:
         return output
 
     def create_pattern_mapper(self) -> tuple[PatternMapper, torch.Tensor, torch.Tensor]:
-        """Create pattern mapper for sparse matrix operations.
+        """Create (or reuse) the pattern mapper for sparse matrix operations.
+
+        The sparsity pattern only depends on the network topology, so the
+        mapper is cached and reused across setup_inputs()/forward() and
+        across batches that share an adjacency matrix (inference).
 
         Returns
         -------
@@ -452,10 +559,12 @@ class MuskingumCunge:
         """
         if self.network is None:
             raise ValueError("Network not set. Call setup_inputs() first.")
-        matrix_dims = self.network.shape[0]
-        mapper = PatternMapper(self.fill_op, matrix_dims, device=self.device)
-        dense_rows, dense_cols = get_network_idx(mapper)
-        return mapper, dense_rows, dense_cols
+        if self._mapper is None:
+            matrix_dims = self.network.shape[0]
+            self._mapper = PatternMapper(self.fill_op, matrix_dims, device=self.device)
+            self._mapper_rows, self._mapper_cols = get_network_idx(self._mapper)
+        assert self._mapper_rows is not None and self._mapper_cols is not None
+        return self._mapper, self._mapper_rows, self._mapper_cols
 
     def calculate_muskingum_coefficients(
         self, length: torch.Tensor, velocity: torch.Tensor, x_storage: torch.Tensor
@@ -476,13 +585,11 @@ class MuskingumCunge:
         Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]
             Routing coefficients c1, c2, c3, c4
         """
-        k = torch.div(length, velocity)
-        denom = (2.0 * k * (1.0 - x_storage)) + self.t
-        c_1 = (self.t - (2.0 * k * x_storage)) / denom
-        c_2 = (self.t + (2.0 * k * x_storage)) / denom
-        c_3 = ((2.0 * k * (1.0 - x_storage)) - self.t) / denom
-        c_4 = (2.0 * self.t) / denom
-        return c_1, c_2, c_3, c_4
+        # Scripted functions are untyped to mypy, so pin the return type here
+        return cast(
+            tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor],
+            _muskingum_coefficients(length, velocity, x_storage, self.t),
+        )
 
     def route_timestep(
         self,
@@ -534,12 +641,8 @@ class MuskingumCunge:
         # Calculate inflow from upstream
         i_t = torch.matmul(self.network, self._discharge_t)
 
-        # Calculate right-hand side of equation
-        b = (c_2 * i_t) + (c_3 * self._discharge_t) + (c_4 * q_prime_clamp)
-
-        # Setup sparse matrix for solving
-        c_1_ = c_1 * -1
-        c_1_[0] = 1.0
+        # Calculate right-hand side of equation and the negated c_1 diagonal
+        c_1_, b = _muskingum_rhs(c_1, c_2, c_3, c_4, i_t, self._discharge_t, q_prime_clamp)
         A_values = mapper.map(c_1_)
 
         # Solve the linear system
@@ -76,15 +76,9 @@ class PatternMapper:
         self.crow_indices = A.crow_indices()
         self.col_indices = A.col_indices()
 
-        I_matrix = A.values().int() - offset
-        # this mapping is: datvec(I(i)) --> sp.values(i)
-        # this is equivalent to datvec * M
-        # where M is a zero matrix with 1 at (I(i),i)
-        C = torch.arange(0, len(I_matrix), device=device) + indShift
-        indices = torch.stack((I_matrix, C), 0)
-        ones = torch.ones(len(I_matrix), device=device)
-        M_coo = torch.sparse_coo_tensor(indices, ones, size=(matrix_dim, len(I_matrix)), device=device)
-        self.M_csr = M_coo.to_sparse_csr()
+        # this mapping is: datvec(I(i)) --> sp.values(i), so map() is a
+        # pure gather — no selector-matrix matmul needed
+        self._gather_idx = A.values().long() - offset
 
     def map(self, datvec: torch.Tensor) -> torch.Tensor:
         """Map input vector to sparse matrix format.
@@ -99,7 +93,7 @@ class PatternMapper:
         torch.Tensor
             Mapped dense tensor.
         """
-        return torch.matmul(datvec, self.M_csr).to_dense()
+        return datvec[self._gather_idx]
 
     def getSparseIndices(self) -> tuple[torch.Tensor, torch.Tensor]:
         """Retrieve sparse matrix indices."""
@@ -108,11 +102,7 @@ class PatternMapper:
     @staticmethod
     def inverse_diag_fill(data_vector: torch.Tensor) -> torch.Tensor:
         """Fill matrix diagonally with inverse ordering of data vector."""
-        n = data_vector.shape[0]
-        A = torch.zeros([n, n], dtype=data_vector.dtype)
-        for i in range(n):
-            A[i, i] = data_vector[n - 1 - i]
-        return A
+        return torch.diag(torch.flip(data_vector, dims=[0]))
 
     @staticmethod
     def diag_aug(
@@ -150,17 +140,8 @@ def get_network_idx(mapper: PatternMapper) -> tuple[torch.Tensor, torch.Tensor]:
     tuple[torch.Tensor, torch.Tensor]
         The sparse rows and columns contained in the pattern mapper
     """
-    rows = []
-    cols = []
-    crow_indices_list = mapper.crow_indices.tolist()
-    col_indices_list = mapper.col_indices.tolist()
-    for i in range(len(crow_indices_list) - 1):
-        start, end = crow_indices_list[i], crow_indices_list[i + 1]
-        these_cols = col_indices_list[start:end]
-        these_rows = [i] * len(these_cols)
-        rows.extend(these_rows)
-        cols.extend(these_cols)
-    return torch.tensor(rows), torch.tensor(cols)
+    rows = _compute_row_indices(mapper.crow_indices, mapper.col_indices.numel())
+    return rows, mapper.col_indices
 
 
 def denormalize(value: torch.Tensor, bounds: list[float], log_space: bool = False) -> torch.Tensor:
@@ -225,21 +206,21 @@ def _backward_cpu(
     n = len(crow_indices) - 1
 
     # Convert to SciPy CSR matrix
-    crow_np = crow_indices.cpu().numpy().astype(np.int32)
-    col_np = col_indices.cpu().numpy().astype(np.int32)
-    data_np = A_values.cpu().numpy().astype(np.float64)
+    crow_np = crow_indices.cpu().numpy().astype(np.int32, copy=False)
+    col_np = col_indices.cpu().numpy().astype(np.int32, copy=False)
+    data_np = A_values.cpu().numpy().astype(np.float32, copy=False)
 
     A_scipy = sp.csr_matrix((data_np, col_np, crow_np), shape=(n, n))
 
     A_T_scipy = A_scipy.T
 
     # Solve transposed system
-    grad_output_np = grad_output.cpu().numpy().astype(np.float64)
+    grad_output_np = grad_output.cpu().numpy().astype(np.float32, copy=False)
     gradb_np = spsolve_triangular(
         A_T_scipy, grad_output_np, lower=transposed_lower, unit_diagonal=unit_diagonal
     )
 
-    return torch.tensor(gradb_np, dtype=grad_output.dtype, device=grad_output.device)
+    return torch.from_numpy(gradb_np).to(dtype=grad_output.dtype, device=grad_output.device)
 
 
 def _backward_gpu(
@@ -324,7 +305,6 @@ def _compute_A_gradients(
     col_indices: torch.Tensor,
     x: torch.Tensor,
     gradb: torch.Tensor,
-    device: str | torch.device,
 ) -> torch.Tensor:
     """
     Gradient computation for sparse matrix values A_values.
@@ -345,8 +325,6 @@ def _compute_A_gradients(
         Solution vector from the forward pass (Ax = b).
     gradb : torch.Tensor
         Gradient with respect to the right-hand side vector b.
-    device : str | torch.device
-        Device where computations should be performed.
 
     Returns
     -------
@@ -355,90 +333,31 @@ def _compute_A_gradients(
 
     Notes
     -----
-    This function uses vectorized operations to compute gradients efficiently:
-    - On CPU: Pre-allocates arrays and uses vectorized row index computation
-    - On GPU: Uses torch.repeat_interleave for efficient row index generation
+    The row indices are expanded with torch.repeat_interleave on whatever
+    device the CSR structure lives on, so the whole gradient is a single
+    fused gather — no Python loops or .item() syncs on either CPU or GPU.
 
     The gradient computation is based on the matrix calculus identity for linear solves.
     """
-    if device == "cpu":
-        # CPU path - vectorized operations
-        crow_indices_cpu = crow_indices.cpu()
-
-        # Pre-allocate arrays for better memory access
-        nnz = len(A_values)
-        row_indices = torch.empty(nnz, dtype=torch.long, device="cpu")
-
-        # Vectorized row index computation
-        _fill_row_indices_vectorized(crow_indices_cpu, row_indices)
+    row_indices = _compute_row_indices(crow_indices, len(A_values))
 
-        # Move to target device and compute gradients
-        row_indices = row_indices.to(device)
-        col_indices_device = col_indices.to(device)
-
-        # Vectorized gradient computation: -gradb[rows] * x[cols]
-        gradA_values = -gradb[row_indices] * x[col_indices_device]
-
-    else:
-        # GPU path - keep everything on GPU
-        row_indices = _compute_row_indices_gpu(crow_indices, len(A_values))
-
-        # Vectorized gradient computation on GPU
-        gradA_values = -gradb[row_indices] * x[col_indices]
+    # Vectorized gradient computation: -gradb[rows] * x[cols]
+    gradA_values = -gradb[row_indices] * x[col_indices]
 
     return gradA_values
 
 
-def _fill_row_indices_vectorized(crow_indices: torch.Tensor, row_indices: torch.Tensor) -> None:
-    """
-    Vectorized computation of row indices from CSR crow_indices for CPU.
-
-    Fills the row_indices tensor with the row index for each non-zero element
-    in the sparse matrix, based on the CSR format's crow_indices.
-
-    Parameters
-    ----------
-    crow_indices : torch.Tensor
-        Row pointers for the CSR format. Should be on CPU.
-    row_indices : torch.Tensor
-        Pre-allocated tensor to store row indices. Will be modified in-place.
-
-    Notes
-    -----
-    This function operates in-place on the row_indices tensor for memory efficiency.
-    The crow_indices[i] gives the starting position in the values array for row i,
-    and crow_indices[i+1] gives the ending position.
-
-    Examples
-    --------
-    For a 3x3 matrix with crow_indices = [0, 2, 3, 5]:
-    - Row 0 has 2 non-zeros at positions 0, 1
-    - Row 1 has 1 non-zero at position 2
-    - Row 2 has 2 non-zeros at positions 3, 4
-    Result: row_indices = [0, 0, 1, 2, 2]
-    """
-    n = len(crow_indices) - 1
-    idx = 0
-
-    for i in range(n):
-        start, end = crow_indices[i].item(), crow_indices[i + 1].item()
-        count = end - start
-        if count > 0:
-            row_indices[idx : idx + count] = i
-            idx += count
-
-
-def _compute_row_indices_gpu(crow_indices: torch.Tensor, nnz: int) -> torch.Tensor:
+def _compute_row_indices(crow_indices: torch.Tensor, nnz: int) -> torch.Tensor:
     """
-    GPU computation of row indices using PyTorch operations.
+    Compute row indices for each non-zero element using PyTorch operations.
 
-    Computes row indices for each non-zero element in a sparse matrix using
-    efficient GPU operations, avoiding CPU-GPU transfers.
+    Expands the CSR row pointers into an explicit row index per non-zero,
+    staying on whatever device crow_indices lives on.
 
     Parameters
     ----------
     crow_indices : torch.Tensor
-        Row pointers for the CSR format. Should be on GPU.
+        Row pointers for the CSR format.
     nnz : int
         Number of non-zero elements in the sparse matrix.
 
@@ -449,9 +368,8 @@ def _compute_row_indices_gpu(crow_indices: torch.Tensor, nnz: int) -> torch.Tens
 
     Notes
     -----
-    This function uses torch.repeat_interleave which is on GPU
-    and avoids the Python loops required in the CPU version. The operation is
-    equivalent to expanding each row index i by the number of non-zeros in that row.
+    torch.repeat_interleave expands each row index i by the number of
+    non-zeros in that row — pure index arithmetic with no Python loop.
 
     Examples
     --------
@@ -461,7 +379,6 @@ def _compute_row_indices_gpu(crow_indices: torch.Tensor, nnz: int) -> torch.Tens
     - Row 2: 2 non-zeros
     Result: [0, 0, 1, 2, 2]
     """
-    # Use torch operations to avoid CPU-GPU transfers
     device = crow_indices.device
     n = len(crow_indices) - 1
 
@@ -585,16 +502,19 @@ class TriangularSparseSolver(torch.autograd.Function):
         n = len(crow_indices) - 1
 
         if device == "cpu":
-            crow_np = crow_indices.cpu().numpy().astype(np.int32)
-            col_np = col_indices.cpu().numpy().astype(np.int32)
-            data_np = A_values.cpu().numpy().astype(np.float64)
-            b_np = b.cpu().numpy().astype(np.float64)
+            # Solve in float32 to match the rest of the dmc pipeline; the
+            # result was truncated back to b.dtype anyway, so float64 only
+            # doubled memory traffic. copy=False keeps matching dtypes zero-copy
+            crow_np = crow_indices.cpu().numpy().astype(np.int32, copy=False)
+            col_np = col_indices.cpu().numpy().astype(np.int32, copy=False)
+            data_np = A_values.cpu().numpy().astype(np.float32, copy=False)
+            b_np = b.cpu().numpy().astype(np.float32, copy=False)
 
             A_scipy = sp.csr_matrix((data_np, col_np, crow_np), shape=(n, n))
 
             try:
                 x_np = spsolve_triangular(A_scipy, b_np, lower=lower, unit_diagonal=unit_diagonal)
-                x = torch.tensor(x_np, dtype=b.dtype, device=b.device)
+                x = torch.from_numpy(x_np).to(dtype=b.dtype, device=b.device)
             except ValueError as e:
                 log.error(f"CPU triangular sparse solve failed: {e}")
                 raise ValueError(f"SciPy triangular sparse solver failed: {e}") from e
@@ -602,15 +522,15 @@ class TriangularSparseSolver(torch.autograd.Function):
             try:
                 cuda_device = cp.cuda.Device(device)
                 with cuda_device:
-                    data_cp = torch_to_cupy(A_values).astype(cp.float32)
-                    indices_cp = torch_to_cupy(col_indices).astype(cp.int32)
-                    indptr_cp = torch_to_cupy(crow_indices).astype(cp.int32)
-                    b_cp = torch_to_cupy(b).astype(cp.float32)
+                    # astype(copy=False) keeps the dlpack views zero-copy when the
+                    # dtypes already match (the per-timestep hot path)
+                    data_cp = torch_to_cupy(A_values).astype(cp.float32, copy=False)
+                    indices_cp = torch_to_cupy(col_indices).astype(cp.int32, copy=False)
+                    indptr_cp = torch_to_cupy(crow_indices).astype(cp.int32, copy=False)
+                    b_cp = torch_to_cupy(b).astype(cp.float32, copy=False)
                     A_cp = cp_csr_matrix((data_cp, indices_cp, indptr_cp), shape=(n, n))
 
-                    x_cp = cp_spsolve_triangular(A_cp, b_cp, lower=lower, unit_diagonal=unit_diagonal).astype(
-                        cp.float32
-                    )
+                    x_cp = cp_spsolve_triangular(A_cp, b_cp, lower=lower, unit_diagonal=unit_diagonal)
 
                     x = cupy_to_torch(x_cp)
 
@@ -686,7 +606,7 @@ class TriangularSparseSolver(torch.autograd.Function):
 
         # gradient computation for A_values if needed
         if A_values.requires_grad:
-            gradA_values = _compute_A_gradients(A_values, crow_indices, col_indices, x, gradb, device)
+            gradA_values = _compute_A_gradients(A_values, crow_indices, col_indices, x, gradb)
             return gradA_values, None, None, gradb, None, None, None
         else:
             return None, None, None, gradb, None, None, None
@@ -11,6 +11,7 @@ import numpy as np
 import torch
 
 from ddr.io.functions import downsample
+from ddr.validation.utils import load_state
 
 log = logging.getLogger(__name__)
 
@@ -65,7 +66,7 @@ def load_checkpoint(
     """
     file_path = Path(checkpoint_path)
     log.info(f"Loading spatial_nn from checkpoint: {file_path.stem}")
-    state: dict = torch.load(file_path, map_location=device)
+    state: dict = load_state(file_path, map_location=device)
     state_dict = state["model_state_dict"]
     for key in state_dict.keys():
         state_dict[key] = state_dict[key].to(device)
@@ -52,9 +52,10 @@ class TestMuskingumCungeInputSetup:
         assert torch.equal(mc.q_prime, streamflow)
         assert mc.spatial_parameters == spatial_params
 
-        # Check network setup
+        # Check network setup — dense adjacency inputs are converted to sparse CSR
         assert mc.network is not None
-        assert torch.equal(mc.network, hydrofabric.adjacency_matrix)
+        assert mc.network.layout == torch.sparse_csr
+        assert torch.equal(mc.network.to_dense(), hydrofabric.adjacency_matrix)
         assert mc.observations == hydrofabric.observations.gage_id
 
         # Check spatial attributes
@@ -175,10 +176,11 @@ class TestMuskingumCungeSparseOperations:
         result = mc.fill_op(data_vector)
 
         assert result.shape == (3, 3)
-        # For fill_op, the result might be dense depending on implementation
-        # Just check that it produces reasonable output
-        assert not torch.isnan(result).any()
-        assert not torch.isinf(result).any()
+        # fill_op returns a sparse matrix when the network is sparse CSR;
+        # densify to inspect the values
+        dense = result.to_dense() if result.layout != torch.strided else result
+        assert not torch.isnan(dense).any()
+        assert not torch.isinf(dense).any()
 
 
 class TestMuskingumCungeCoefficients:
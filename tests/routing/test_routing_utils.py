@@ -1,11 +1,11 @@
 """Tests for ddr.routing.utils — denormalize, PatternMapper, get_network_idx,
-TriangularSparseSolver, and _fill_row_indices_vectorized."""
+TriangularSparseSolver, and _compute_row_indices."""
 
 import torch
 
 from ddr.routing.utils import (
     PatternMapper,
-    _fill_row_indices_vectorized,
+    _compute_row_indices,
     denormalize,
     get_network_idx,
     triangular_sparse_solve,
@@ -167,14 +167,19 @@ class TestTriangularSparseSolver:
 
 
 # ---------------------------------------------------------------------------
-# _fill_row_indices_vectorized()
+# _compute_row_indices()
 # ---------------------------------------------------------------------------
-class TestFillRowIndicesVectorized:
-    """Tests for _fill_row_indices_vectorized()."""
+class TestComputeRowIndices:
+    """Tests for _compute_row_indices()."""
 
-    def test_fill_row_indices_known_csr(self) -> None:
+    def test_compute_row_indices_known_csr(self) -> None:
         crow_indices = torch.tensor([0, 2, 3, 5])
-        row_indices = torch.empty(5, dtype=torch.long)
-        _fill_row_indices_vectorized(crow_indices, row_indices)
+        row_indices = _compute_row_indices(crow_indices, 5)
         expected = torch.tensor([0, 0, 1, 2, 2])
         assert torch.equal(row_indices, expected)
+
+    def test_compute_row_indices_empty_rows(self) -> None:
+        crow_indices = torch.tensor([0, 0, 2, 2, 3])
+        row_indices = _compute_row_indices(crow_indices, 3)
+        expected = torch.tensor([1, 1, 3])
+        assert torch.equal(row_indices, expected)
@@ -5,7 +5,7 @@ from pathlib import Path
 import numpy as np
 import torch
 
-from ddr.validation.utils import log_metrics, save_state
+from ddr.validation.utils import load_state, log_metrics, save_state
 
 
 class TestSaveState:
@@ -45,12 +45,32 @@ class TestSaveState:
         )
 
         files = list(tmp_path.glob("*.pt"))
-        state = torch.load(files[0], weights_only=False)
+        state = load_state(files[0])
         assert "model_state_dict" in state
         assert "optimizer_state_dict" in state
         assert "epoch" in state
         assert state["epoch"] == 6  # mini_batch=-1 → epoch+1
 
+    def test_save_state_weights_roundtrip(self, tmp_path: Path) -> None:
+        model = torch.nn.Linear(3, 2)
+        optimizer = torch.optim.Adam(model.parameters(), lr=0.01)
+        generator = torch.Generator()
+
+        save_state(
+            epoch=1,
+            generator=generator,
+            mini_batch=0,
+            mlp=model,
+            optimizer=optimizer,
+            name="test",
+            saved_model_path=tmp_path,
+        )
+
+        files = list(tmp_path.glob("*.pt"))
+        state = load_state(files[0])
+        for key, value in model.state_dict().items():
+            assert torch.equal(state["model_state_dict"][key], value)
+
 
 class TestLogMetrics:
     """Tests for log_metrics()."""